@@ -7,14 +7,25 @@ import multiprocessing
 import sys
 from threading import Thread, main_thread
 
-from term_image.utils import write_tty
-
+from . import __version__
 from .ctlseqs import RESTORE_WINDOW_TITLE_b, SAVE_WINDOW_TITLE_b, SET_WINDOW_TITLE_b
-from .exit_codes import FAILURE, INTERRUPTED, codes
+from .exit_codes import FAILURE, INTERRUPTED, SUCCESS, codes
 
 
 def main() -> int:
     """CLI execution entry-point"""
+    # Static output; no need to build the parser or even import `term_image`
+    if sys.argv[1:] == ["--version"]:
+        print(__version__)
+        return SUCCESS
+    if sys.argv[1:] == ["--completions"]:
+        from .completions import COMPLETIONS
+
+        sys.stderr.write(COMPLETIONS)  # As `ArgumentParser.exit()` does
+        return SUCCESS
+
+    from term_image.utils import write_tty
+
     try:
         from argcomplete import autocomplete
     except ImportError:
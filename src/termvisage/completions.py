@@ -0,0 +1,45 @@
+"""Shell completion instructions"""
+
+COMPLETIONS = """First and foremost, ensure you've installed `termvisage` with the \
+`completions` extra e.g via
+
+    pipx install "termvisage[completions]"
+
+If that has been done, follow the appropriate instructions for your shell:
+
+Bash or Zsh:
+    Add the following to your shell's config file:
+
+        eval "$(register-python-argcomplete termvisage)"
+
+Tcsh:
+    Add the following to your shell's config file:
+
+        eval "$(register-python-argcomplete --shell tcsh termvisage)"
+
+Fish:
+    Run the following once to create new completion file:
+
+        register-python-argcomplete --shell fish termvisage \
+> ~/.config/fish/completions/termvisage.fish
+
+    OR add the following to your shell's config file:
+
+        register-python-argcomplete --shell fish termvisage | source
+
+Git Bash:
+    Add the following to your shell's config file:
+
+        export ARGCOMPLETE_USE_TEMPFILES=1
+        eval "$(register-python-argcomplete termvisage)"
+
+For other shells, see https://github.com/kislyuk/argcomplete/tree/develop/contrib
+
+NOTES:
+    - If you added a command to your shell's config file, you will likely
+      have to restart the shell or re-login for completion to start working.
+
+    - If `termvisage` was installed using `pipx`, you may need to run:
+
+          pip install --user --upgrade argcomplete
+"""
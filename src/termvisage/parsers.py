@@ -3,54 +3,20 @@
 import re
 import sys
 from argparse import Action, ArgumentParser, RawDescriptionHelpFormatter, _ArgumentGroup
+from functools import lru_cache
 
 from term_image.image import ITerm2Image, Size
 
 from . import __version__
+from .completions import COMPLETIONS
 
-COMPLETIONS = """First and foremost, ensure you've installed `termvisage` with the \
-`completions` extra e.g via
+STYLE_CHOICES = ("auto", "block", "iterm2", "kitty")
+H_ALIGN_CHOICES = ("left", "center", "right")
+V_ALIGN_CHOICES = ("top", "middle", "bottom")
+LOG_LEVEL_CHOICES = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
 
-    pipx install "termvisage[completions]"
-
-If that has been done, follow the appropriate instructions for your shell:
-
-Bash or Zsh:
-    Add the following to your shell's config file:
-
-        eval "$(register-python-argcomplete termvisage)"
-
-Tcsh:
-    Add the following to your shell's config file:
-
-        eval "$(register-python-argcomplete --shell tcsh termvisage)"
-
-Fish:
-    Run the following once to create new completion file:
-
-        register-python-argcomplete --shell fish termvisage \
-> ~/.config/fish/completions/termvisage.fish
-
-    OR add the following to your shell's config file:
-
-        register-python-argcomplete --shell fish termvisage | source
-
-Git Bash:
-    Add the following to your shell's config file:
-
-        export ARGCOMPLETE_USE_TEMPFILES=1
-        eval "$(register-python-argcomplete termvisage)"
-
-For other shells, see https://github.com/kislyuk/argcomplete/tree/develop/contrib
-
-NOTES:
-    - If you added a command to your shell's config file, you will likely
-      have to restart the shell or re-login for completion to start working.
-
-    - If `termvisage` was installed using `pipx`, you may need to run:
-
-          pip install --user --upgrade argcomplete
-"""
+DEFAULT_ALPHA = 40 / 255
+DEFAULT_MAX_DEPTH = sys.getrecursionlimit() - 50
 
 
 class BasicHelpAction(Action):
@@ -77,24 +43,26 @@ class CompletionsAction(Action):
         parser.exit(message=COMPLETIONS)
 
 
-def rst_role_repl(match):
-    if match.group(1) in {"option", "confval"}:
-        return f"`{match.group(2)}`"
-    return match.group(2)
+MARKUP_CHAR_RE = re.compile(r"[`*\\[]")
+OPTION_ROLE_RE = re.compile(r":(?:option|confval):`([^`]+?)(?: <[^`]+>)?`")
+ROLE_RE = re.compile(r":\w+:`([^`]+?)(?: <[^`]+>)?`")
+BOLD_RE = re.compile(r"\*\*([^*]+)\*\*")
+ITALIC_RE = re.compile(r"\*([^*]+)\*")
+FOOTNOTE_REF_RE = re.compile(r" \[.+\]_")
 
 
+@lru_cache(maxsize=None)
 def strip_markup(string: str) -> str:
     """Strip selected reST markup from the *string*."""
-    if string:
+    if string and MARKUP_CHAR_RE.search(string):
         string = string.replace("``", "`")
         string = string.replace("\\", "")
-        for pattern, repl in (
-            (r":(\w+):`(.+?)( <.+>)?`", rst_role_repl),
-            (r"\*\*(.+?)\*\*", r"\1"),
-            (r"\*(.+?)\*", r"\1"),
-            (r" \[.+\]_", ""),
-        ):
-            string = re.sub(pattern, repl, string)
+        string = OPTION_ROLE_RE.sub(r"`\1`", string)
+        string = ROLE_RE.sub(r"\1", string)
+        if "*" in string:
+            string = BOLD_RE.sub(r"\1", string)
+            string = ITALIC_RE.sub(r"\1", string)
+        string = FOOTNOTE_REF_RE.sub("", string)
 
     return string
 
@@ -103,6 +71,31 @@ def strip_markup(string: str) -> str:
 # markup but ensure any markup used is stripped by `strip_markup()`.
 
 
+# Common Arguments
+#
+# Specified identically in both the basic and main parsers
+# ======================================================================================
+
+info_args = (
+    (
+        ("--version",),
+        dict(
+            action="version",
+            version=__version__,
+            help="Show the program version and exit",
+        ),
+    ),
+    (
+        ("--completions",),
+        dict(
+            nargs=0,
+            action=CompletionsAction,
+            help="Show instructions to enable shell completions and exit",
+        ),
+    ),
+)
+
+
 # Basic Parser
 #
 # Main parser subset with only arguments/options for basic usage (for `--help`)
@@ -141,22 +134,12 @@ basic_help_options.add_argument(
     help="Show the full help message and exit",
 )
 
-basic_parser.add_argument(
-    "--version",
-    action="version",
-    version=__version__,
-    help="Show the program version and exit",
-)
-basic_parser.add_argument(
-    "--completions",
-    nargs=0,
-    action=CompletionsAction,
-    help="Show instructions to enable shell completions and exit",
-)
+for args, kwargs in info_args:
+    basic_parser.add_argument(*args, **kwargs)
 basic_parser.add_argument(
     "-S",
     "--style",
-    choices=("auto", "block", "iterm2", "kitty"),
+    choices=STYLE_CHOICES,
     help="Image :term:`render style` (default: :confval:`style` config)",
 )
 basic_parser.add_argument(
@@ -242,18 +225,8 @@ help_options.add_argument(
     help="Show this help message and exit",
 )
 
-general.add_argument(
-    "--version",
-    action="version",
-    version=__version__,
-    help="Show the program version and exit",
-)
-general.add_argument(
-    "--completions",
-    nargs=0,
-    action=CompletionsAction,
-    help="Show instructions to enable shell completions and exit",
-)
+for args, kwargs in info_args:
+    general.add_argument(*args, **kwargs)
 general.add_argument(
     "--query-timeout",
     type=float,
@@ -266,7 +239,7 @@ general.add_argument(
 general.add_argument(
     "-S",
     "--style",
-    choices=("auto", "block", "iterm2", "kitty"),
+    choices=STYLE_CHOICES,
     help="Image :term:`render style` (default: :confval:`style` config) [#]_",
 )
 general.add_argument(
@@ -398,10 +371,10 @@ alpha_options.add_argument(
     "--alpha",
     type=float,
     metavar="N",
-    default=40 / 255,
+    default=DEFAULT_ALPHA,
     help=(
         "Alpha ratio above which pixels are taken as opaque (0 <= *N* < 1), "
-        f"for text-based :term:`render styles` (default: {40 / 255:f})"
+        f"for text-based :term:`render styles` (default: {DEFAULT_ALPHA:f})"
     ),
 )
 alpha_options.add_argument(
@@ -551,7 +524,7 @@ align_options.add_argument(
 align_options.add_argument(
     "-H",
     "--h-align",
-    choices=("left", "center", "right"),
+    choices=H_ALIGN_CHOICES,
     help=":term:`Horizontal alignment` (default: center)",
 )
 align_options.add_argument(
@@ -566,7 +539,7 @@ align_options.add_argument(
 align_options.add_argument(
     "-V",
     "--v-align",
-    choices=("top", "middle", "bottom"),
+    choices=V_ALIGN_CHOICES,
     help=":term:`Vertical alignment` (default: middle)",
 )
 align_options.add_argument(
@@ -600,8 +573,8 @@ tui_options.add_argument(
     "--max-depth",
     type=int,
     metavar="N",
-    default=sys.getrecursionlimit() - 50,
-    help=f"Maximum recursion depth (default: {sys.getrecursionlimit() - 50})",
+    default=DEFAULT_MAX_DEPTH,
+    help=f"Maximum recursion depth (default: {DEFAULT_MAX_DEPTH})",
 )
 tui_options.add_argument(
     "--thumbnail",
@@ -668,7 +641,7 @@ log_options_.add_argument(
 )
 log_options.add_argument(
     "--log-level",
-    choices=("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"),
+    choices=LOG_LEVEL_CHOICES,
     default="WARNING",
     help="Logging level for the session (default: WARNING) [#]_",
 )
@@ -791,11 +764,18 @@ iterm2_options.add_argument(
 
 style_parsers = {"kitty": kitty_parser, "iterm2": iterm2_parser}
 
+actions, option_string_actions, action_groups, mutually_exclusive_groups = (
+    parser._actions,
+    parser._option_string_actions,
+    parser._action_groups,
+    parser._mutually_exclusive_groups,
+)
 for style_parser in style_parsers.values():
-    parser._actions.extend(style_parser._actions)
-    parser._option_string_actions.update(style_parser._option_string_actions)
-    parser._action_groups.extend(style_parser._action_groups)
-    parser._mutually_exclusive_groups.extend(style_parser._mutually_exclusive_groups)
+    actions += style_parser._actions
+    option_string_actions.update(style_parser._option_string_actions)
+    action_groups += style_parser._action_groups
+    mutually_exclusive_groups += style_parser._mutually_exclusive_groups
+del actions, option_string_actions, action_groups, mutually_exclusive_groups
 
 
 # Help Text Customization
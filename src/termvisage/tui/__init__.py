@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import logging as _logging
 import os
-from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict
 
 if TYPE_CHECKING:
@@ -67,10 +66,15 @@ def init(
     main.THUMBNAIL = args.thumbnail and TEMP_DIR
     main.THUMBNAIL_SIZE_PRODUCT = config_options.thumbnail_size**2
     main.ImageClass = ImageClass
-    main.loop = Loop(
-        main_widget, palette, UrwidImageScreen(), unhandled_input=process_input
+    keys._clear_images = getattr(ImageClass, "clear", lambda: True)
+    screen = UrwidImageScreen()
+    # Set before the palette is registered; otherwise, all palette entries get
+    # re-processed for the new color mode.
+    screen.set_terminal_properties(2**24)
+    main.loop = Loop(main_widget, palette, screen, unhandled_input=process_input)
+    main.update_pipe = main.loop.watch_pipe(
+        lambda _: main.screen_update_pending.clear()
     )
-    main.update_pipe = main.loop.watch_pipe(lambda _: None)
 
     render.ANIM_CACHED = not args.cache_no_anim and (
         args.cache_all_anim or args.anim_cache
@@ -82,19 +86,25 @@ def init(
     images = [
         entry if entry[1] is ... else (entry[0], Image(entry[1])) for entry in images
     ]
-    images.sort(
-        key=lambda x: sort_key_lexi(
-            Path(x[0] if x[1] is ... else x[1]._ti_image.source),
-            # For the sake of URL-sourced images
-            x[0] if x[1] is ... else x[1]._ti_image._source,
-        )
-    )
+
+    def images_sort_key(entry):
+        path, image = entry
+        # Directories and image files respectively, as validated by the CLI
+        if image is ...:
+            return sort_key_lexi(path, False)
+        return sort_key_lexi(image._ti_image.source, True)
+
+    images.sort(key=images_sort_key)
     main.displayer = main.display_images(".", images, contents, top_level=True)
 
     if "compress" in style_args:
-        for name in ("anim", "grid", "image"):
-            specs = getattr(render, f"{name}_style_specs")
-            specs[ImageClass.style] += f"c{style_args['compress']}"
+        compress_spec = f"c{style_args['compress']}"
+        for specs in (
+            render.anim_style_specs,
+            render.grid_style_specs,
+            render.image_style_specs,
+        ):
+            specs[ImageClass.style] += compress_spec
 
     if issubclass(ImageClass, GraphicsImage):
         # `get_cell_size()` may sometimes return `None` on terminals that don't
@@ -110,7 +120,9 @@ def init(
             else "#" + (args.alpha_bg or "#")
         )
     )
-    Image._ti_grid_style_spec = render.grid_style_specs.get(ImageClass.style, "")
+    Image._ti_grid_format_spec = (
+        f"1.1{Image._ti_alpha}{render.grid_style_specs.get(ImageClass.style, '')}"
+    )
     if main.THUMBNAIL:
         Image._ti_update_grid_thumbnailing_threshold(keys._prev_cell_size)
 
@@ -142,9 +154,15 @@ def init(
         daemon=True,
     )
 
+    def stop_image_render_managers():
+        # Signal both before waiting on either, so they can wind down concurrently
+        render.image_render_queue.put((None,) * 3)
+        render.anim_render_queue.put((None,) * 3)
+        image_render_manager.join()
+        anim_render_manager.join()
+
     UrwidImageScreen.draw_screen = lock_tty(UrwidImageScreen.draw_screen)
     main.loop.screen.clear()
-    main.loop.screen.set_terminal_properties(2**24)
 
     logger = _logging.getLogger(__name__)
     log("Launching the TUI", logger, direct=False)
@@ -177,17 +195,11 @@ def init(
         if main.THUMBNAIL:
             grid_thumbnail_manager.join()
         grid_render_manager.join()
-        render.image_render_queue.put((None,) * 3)
-        image_render_manager.join()
-        render.anim_render_queue.put((None,) * 3)
-        anim_render_manager.join()
+        stop_image_render_managers()
         log("Exited TUI normally", logger, direct=False)
     except Exception:
         quitting = True
-        render.image_render_queue.put((None,) * 3)
-        image_render_manager.join()
-        render.anim_render_queue.put((None,) * 3)
-        anim_render_manager.join()
+        stop_image_render_managers()
         raise
     finally:
         main.displayer.close()
@@ -196,7 +208,7 @@ def init(
 
 
 active = initialized = quitting = False
-palette = [
+palette = (
     ("default", "", "", "", "", ""),
     ("default bold", "", "", "", "bold", ""),
     ("reverse", "", "", "", "standout", ""),
@@ -216,4 +228,4 @@ palette = [
     ("warning", "", "", "", "#ff0000,bold", ""),
     ("notif context", "", "", "", "#0000ff,bold", ""),
     ("high-res", "", "", "", "#a07f00", ""),
-]
+)
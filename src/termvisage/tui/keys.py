@@ -4,10 +4,10 @@ from __future__ import annotations
 
 import logging as _logging
 import os
+from contextlib import contextmanager
 from os.path import abspath, basename
-from time import sleep
 from types import FunctionType
-from typing import Any, Tuple
+from typing import Any, Callable, Generator, Tuple
 
 import urwid
 from term_image import get_cell_ratio
@@ -42,36 +42,85 @@ from .widgets import (
 # Action Status Modification
 
 
+@contextmanager
+def batch_action_bar_updates() -> Generator[None, None, None]:
+    """Defers action bar updates due to changes in action states until the end of the
+    context, such that the action bar is updated at most once per context.
+
+    Can also be used as a function decorator.
+    """
+    global _action_bar_batch_depth
+
+    _action_bar_batch_depth += 1
+    try:
+        yield
+    finally:
+        _action_bar_batch_depth -= 1
+        if not _action_bar_batch_depth:
+            for context in _pending_action_bar_updates:
+                action_bar.update(context)
+            _pending_action_bar_updates.clear()
+
+
+def update_action_bar(context: str) -> None:
+    """Updates the action bar after a change in the action states of *context*,
+    if *context* is the current or global context.
+
+    The update is deferred within ``batch_action_bar_updates()``.
+    """
+    if context == main.get_context() or context == "global":
+        if _action_bar_batch_depth:
+            _pending_action_bar_updates[context] = None
+        else:
+            action_bar.update(context)
+
+
 def disable_actions(context: str, *actions: str) -> None:
-    keyset = context_keys[context]
+    entries = _action_entries[context]
+    changed = False
     for action in actions:
-        keyset[action][4] = False
-        keys[context][keyset[action][0]][1] = False
-    if context == main.get_context() or context == "global":
-        action_bar.update(context)
+        action_entry, key_entry = entries[action]
+        if action_entry[4]:
+            action_entry[4] = key_entry[1] = False
+            changed = True
+    if changed:
+        update_action_bar(context)
 
 
 def enable_actions(context: str, *actions: str) -> None:
-    keyset = context_keys[context]
+    entries = _action_entries[context]
+    changed = False
     for action in actions:
-        keyset[action][4] = True
-        keys[context][keyset[action][0]][1] = True
-    if context == main.get_context() or context == "global":
-        action_bar.update(context)
+        action_entry, key_entry = entries[action]
+        if not action_entry[4]:
+            action_entry[4] = key_entry[1] = True
+            changed = True
+    if changed:
+        update_action_bar(context)
 
 
 def hide_actions(context: str, *actions: str) -> None:
-    keyset = context_keys[context]
+    entries = _action_entries[context]
     for action in actions:
-        keyset[action][3] = False
-    disable_actions(context, *actions)
+        action_entry, key_entry = entries[action]
+        action_entry[3] = action_entry[4] = key_entry[1] = False
+    if context == "global":
+        _help_actions.clear()
+    else:
+        _help_actions.pop(context, None)
+    update_action_bar(context)
 
 
 def show_actions(context: str, *actions: str) -> None:
-    keyset = context_keys[context]
+    entries = _action_entries[context]
     for action in actions:
-        keyset[action][3] = True
-    enable_actions(context, *actions)
+        action_entry, key_entry = entries[action]
+        action_entry[3] = action_entry[4] = key_entry[1] = True
+    if context == "global":
+        _help_actions.clear()
+    else:
+        _help_actions.pop(context, None)
+    update_action_bar(context)
 
 
 # Main
@@ -92,125 +141,60 @@ def display_context_help(context: str) -> None:
     """
     global _prev_view_widget
 
-    actions = (
-        *context_keys[context].items(),
-        *(() if context in no_globals else context_keys["global"].items()),
-    )
-
-    separator = (1, urwid.Filler(urwid.Text("\u2502" * 3)))
-    contents = [
-        (
-            3,
-            urwid.Columns(
-                [
-                    (
-                        "weight",
-                        3,
-                        urwid.Filler(
-                            urwid.Text(("default bold", f"{action}"), "center")
-                        ),
-                    ),
-                    separator,
-                    (
-                        "weight",
-                        2,
-                        urwid.Filler(
-                            urwid.Text(("default bold", f"{symbol} ({key})"), "center")
-                        ),
-                    ),
-                    separator,
-                    (
-                        "weight",
-                        5,
-                        urwid.Filler(
-                            urwid.Text(("default bold", f"{description}"), "center")
-                        ),
-                    ),
-                ],
-                min_width=5,
-            ),
-        )
-        for action, (key, symbol, description, visible, _) in actions
-        if visible
-    ]
-
-    line = urwid.SolidFill("\u2500")
-    divider = urwid.Columns(
-        [
-            ("weight", 3, line),
-            (1, urwid.Filler(urwid.Text("\u253c"))),
-            ("weight", 2, line),
-            (1, urwid.Filler(urwid.Text("\u253c"))),
-            ("weight", 5, line),
-        ],
-        min_width=5,
-    )
-    for index in range(1, (len(contents) - 1) * 2, 2):
-        contents.insert(index, (1, divider))
-
-    contents.insert(
-        0,
-        (
-            1,
-            urwid.Columns(
-                [
-                    ("weight", 3, line),
-                    (1, urwid.Filler(urwid.Text("\u252c"))),
-                    ("weight", 2, line),
-                    (1, urwid.Filler(urwid.Text("\u252c"))),
-                    ("weight", 5, line),
-                ],
-                min_width=5,
-            ),
-        ),
-    )
+    try:
+        actions = _help_actions[context]
+    except KeyError:
+        actions = _help_actions[context] = [
+            (action, properties)
+            for action, properties in (
+                *context_keys[context].items(),
+                *(() if context in no_globals else context_keys["global"].items()),
+            )
+            if properties[3]  # visible
+        ]
 
-    contents.extend(
-        [
+    contents = [_help_top_border]
+    for action, (key, symbol, description, *_) in actions:
+        if len(contents) > 1:
+            contents.append(_help_divider)
+        contents.append(
             (
-                1,
+                3,
                 urwid.Columns(
                     [
-                        ("weight", 3, line),
-                        (1, urwid.Filler(urwid.Text("\u2534"))),
-                        ("weight", 2, line),
-                        (1, urwid.Filler(urwid.Text("\u2534"))),
-                        ("weight", 5, line),
+                        (
+                            "weight",
+                            3,
+                            urwid.Filler(
+                                urwid.Text(("default bold", f"{action}"), "center")
+                            ),
+                        ),
+                        _help_separator,
+                        (
+                            "weight",
+                            2,
+                            urwid.Filler(
+                                urwid.Text(
+                                    ("default bold", f"{symbol} ({key})"), "center"
+                                )
+                            ),
+                        ),
+                        _help_separator,
+                        (
+                            "weight",
+                            5,
+                            urwid.Filler(
+                                urwid.Text(("default bold", f"{description}"), "center")
+                            ),
+                        ),
                     ],
                     min_width=5,
                 ),
-            ),
-            (
-                "pack",
-                urwid.LineBox(
-                    urwid.Text(
-                        [
-                            ("default bold", f"TermVisage v{__version__}\n"),
-                            "\n",
-                            ("default bold", "Homepage: "),
-                            "https://github.com/AnonymouX47/termvisage\n",
-                            ("default bold", "Docs: "),
-                            "https://termvisage.readthedocs.io\n",
-                            ("default bold", "Issue Tracker: "),
-                            "https://github.com/AnonymouX47/termvisage/issues\n",
-                            ("default bold", "Changelog: "),
-                            "https://github.com/AnonymouX47/termvisage/blob/main/"
-                            "CHANGELOG.md\n",
-                            ("default bold", "License: "),
-                            "https://github.com/AnonymouX47/termvisage/blob/main/"
-                            "LICENSE\n",
-                            "\n",
-                            ("default bold", "Copyright (c) 2023 Toluwaleke Ogundipe"),
-                        ],
-                        "center",
-                    ),
-                    "About",
-                    "center",
-                    "default bold",
-                ),
-            ),
-        ]
-    )
+            )
+        )
+
+    contents.append(_help_bottom_border)
+    contents.append(_help_about)
 
     overlay.top_w.original_widget.body[0] = urwid.Pile(contents)
     overlay.bottom_w = view if main.get_context() == "full-image" else pile
@@ -234,13 +218,18 @@ def register_key(*args: Tuple[str, str]) -> FunctionType:
     If no argument is given, the wrapper simply does nothing.
     """
 
+    action_entries = tuple(
+        (context, action, context_keys[context][action]) for context, action in args
+    )
+
     def register(func: FunctionType) -> None:
         """Registers *func* to the key corresponding to each ``(context, action)`` pair
         received by the call to ``register_key()`` that defines it.
         """
-        for context, action in args:
+        for context, action, action_entry in action_entries:
             # All actions are enabled by default
-            keys[context][context_keys[context][action][0]] = [func, True]
+            keys[context][action_entry[0]] = key_entry = [func, True]
+            _action_entries[context][action] = (action_entry, key_entry)
 
         return func
 
@@ -261,7 +250,8 @@ def set_confirmation(
       - msg: The message to be displayed in the dialog.
       - bottom_widget: The widget on which the confirmation dialog will be overlaid.
       - confirm: A function to be called for the "Confirm" action of the
-        confirmation context.
+        confirmation context. It must restore the previous context, possibly
+        at a later time.
       - cancel: A function to be called for the "Cancel" action of the
         confirmation context.
       - confirm_args: Optional positional arguments to be passed to _confirm_.
@@ -287,7 +277,16 @@ def set_confirmation(
     confirmation_overlay.bottom_w = bottom_widget
     main_widget.contents[0] = (confirmation_overlay, ("weight", 1))
 
-    getattr(main.ImageClass, "clear", lambda: True)()
+    _clear_images()
+
+
+def redraw_images() -> None:
+    """Clears all images on screen and forces them to be redrawn, for render styles
+    that support/require clearing.
+    """
+    # `_clear_images()` returns `True` for styles that don't support/require it
+    if not _clear_images():
+        ImageCanvas.change()
 
 
 def update_footer_expand_collapse_icon():
@@ -308,6 +307,13 @@ def update_footer_expand_collapse_icon():
 # {<context>: {<key>: [<func>, <state>], ...}, ...}
 keys = {context: {} for context in context_keys}
 
+# {<context>: {<action>: (<context_keys entry>, <keys entry>), ...}, ...}
+#
+# The entries are the same lists held in `context_keys` and `keys`, which are only
+# ever modified in-place or moved to a new key (by `change_key()`), never replaced.
+# Populated by `register_key()`.
+_action_entries = {context: {} for context in context_keys}
+
 
 # global
 @register_key(("global", "Quit"))
@@ -318,55 +324,73 @@ def quit():
 
 @register_key(("global", "Expand/Collapse Footer"))
 def expand_collapse_keys():
-    if expand._ti_shown:
-        if action_bar._ti_collapsed and action_bar_rows() > 1:
-            update_footer_expand_collapse_icon()
-            main_widget.contents[-1] = (footer, ("given", action_bar_rows()))
-            action_bar._ti_collapsed = False
-            getattr(main.ImageClass, "clear", lambda: True)() or ImageCanvas.change()
-        elif not action_bar._ti_collapsed:
-            update_footer_expand_collapse_icon()
-            main_widget.contents[-1] = (footer, ("given", 1))
-            action_bar._ti_collapsed = True
-            getattr(main.ImageClass, "clear", lambda: True)() or ImageCanvas.change()
+    if not expand._ti_shown:
+        return
+
+    if collapsed := action_bar._ti_collapsed:
+        if (rows := action_bar_rows()) == 1:
+            return
+    else:
+        rows = 1
+
+    update_footer_expand_collapse_icon()
+    main_widget.contents[-1] = (footer, ("given", rows))
+    action_bar._ti_collapsed = not collapsed
+    redraw_images()
 
 
 @register_key(("global", "Help"))
 def help():
     display_context_help(main.get_context())
-    getattr(main.ImageClass, "clear", lambda: True)()
+    _clear_images()
 
 
 def adjust_footer():
     if not config_options.show_footer:
         return
 
-    needed_rows = action_bar.rows((get_terminal_size()[0],))
-    if expand._ti_shown:
+    columns = get_terminal_size()[0]
+    needed_rows = action_bar.rows((columns,))
+    if expand_shown := expand._ti_shown:
         if needed_rows == 1:
             footer.contents.pop()
-            expand._ti_shown = False
+            expand._ti_shown = expand_shown = False
     elif needed_rows > 1:
         footer.contents.append((expand, ("pack", None, False)))
-        expand._ti_shown = True
+        expand._ti_shown = expand_shown = True
 
     if not action_bar._ti_collapsed:
-        if main_widget.contents[-1][1][1] != (rows := action_bar_rows()):
+        # Without the expand key, the action bar spans the entire width
+        rows = action_bar_rows(columns) if expand_shown else needed_rows
+        if main_widget.contents[-1][1][1] != rows:
             main_widget.contents[-1] = (footer, ("given", rows))
-            getattr(main.ImageClass, "clear", lambda: True)()
+            _clear_images()
 
 
-def action_bar_cols():
+def action_bar_cols(columns: int | None = None):
+    columns = columns or get_terminal_size()[0]
     # Consider columns occupied by the expand key and the divider
-    return get_terminal_size()[0] - (expand.pack()[0] + 2) * expand._ti_shown
+    return columns - (expand.pack()[0] + 2) * expand._ti_shown
 
 
-def action_bar_rows():
-    return action_bar.rows((action_bar_cols(),))
+def action_bar_rows(columns: int | None = None):
+    return action_bar.rows((action_bar_cols(columns),))
 
 
 def resize():
-    global _prev_cell_ratio, _prev_cell_size
+    global _resize_alarm
+
+    # Coalesce bursts of resize events e.g while dragging the edge of the terminal
+    # window, into a single update after the last one.
+    if _resize_alarm:
+        main.loop.remove_alarm(_resize_alarm)
+    _resize_alarm = main.loop.set_alarm_in(RESIZE_DELAY, _resize)
+
+
+def _resize(loop: urwid.MainLoop, data: Any) -> None:
+    global _prev_cell_ratio, _prev_cell_size, _resize_alarm
+
+    _resize_alarm = None
 
     if issubclass(main.ImageClass, GraphicsImage):
         cell_size = get_cell_size()
@@ -386,7 +410,7 @@ def resize():
                 resync_grid_rendering()
 
     adjust_footer()
-    getattr(main.ImageClass, "clear", lambda: True)() or ImageCanvas.change()
+    redraw_images()
 
 
 keys["global"].update({"resized": [resize, True]})
@@ -408,6 +432,7 @@ def menu_nav():
         set_menu_count()
 
 
+@batch_action_bar_updates()
 def set_menu_actions():
     pos = menu.focus_position - 1
     if pos == -1:
@@ -434,26 +459,31 @@ def set_menu_actions():
 
 
 def set_menu_count():
+    global _menu_count
+
     length = len(main.menu_list) if main.menu_scan_done.is_set() else "..."
-    menu_box.set_title(f"{menu.focus_position} of {length}")
+    if (count := f"{menu.focus_position} of {length}") != _menu_count:
+        menu_box.set_title(count)
+        _menu_count = count
 
 
 @register_key(("menu", "Open"))
 def open():
-    if menu.focus_position == 0 or main.menu_list[menu.focus_position - 1][1] is ...:
+    pos = menu.focus_position - 1
+    if pos == -1 or main.menu_list[pos][1] is ...:
         main.displayer.send(main.MenuAction.OPEN)
     else:
         main.set_context("full-image")
         main_widget.contents[0] = (view, ("weight", 1))
         set_image_view_actions()
 
-    getattr(main.ImageClass, "clear", lambda: True)()
+    _clear_images()
 
 
 @register_key(("menu", "Back"))
 def back():
     main.displayer.send(main.MenuAction.BACK)
-    getattr(main.ImageClass, "clear", lambda: True)()
+    _clear_images()
 
 
 # image
@@ -463,7 +493,7 @@ def maximize():
     main_widget.contents[0] = (view, ("weight", 1))
     set_image_view_actions()
 
-    getattr(main.ImageClass, "clear", lambda: True)()
+    _clear_images()
 
 
 # image-grid
@@ -475,7 +505,7 @@ def cell_width_dec():
     if image_grid.cell_width > 10:
         image_grid.cell_width -= 2
         resync_grid_rendering()
-        getattr(main.ImageClass, "clear", lambda: True)()
+        _clear_images()
 
         if image_grid.cell_width == 10:
             main.disable_actions("image-grid", "Size-")
@@ -492,7 +522,7 @@ def cell_width_inc():
     if image_grid.cell_width < 50:
         image_grid.cell_width += 2
         resync_grid_rendering()
-        getattr(main.ImageClass, "clear", lambda: True)()
+        _clear_images()
 
         if image_grid.cell_width == 50:
             main.disable_actions("image-grid", "Size+")
@@ -519,7 +549,7 @@ def maximize_cell():
     if image_w._ti_image.is_animated:
         main.animate_image(image_w)
 
-    getattr(main.ImageClass, "clear", lambda: True)()
+    _clear_images()
 
 
 def set_image_grid_actions():
@@ -538,24 +568,26 @@ def restore():
 
     main.set_prev_context()
     main_widget.contents[0] = (pile, ("weight", 1))
-    if main.get_context() == "menu":
+    context = main.get_context()
+    if context == "menu":
         set_menu_actions()
-    elif main.get_context() == "image":
-        set_image_view_actions()
+    elif context == "image":
+        set_image_view_actions(context)
 
-    getattr(main.ImageClass, "clear", lambda: True)()
+    _clear_images()
 
 
 # image, full-image
 @register_key(("image", "Prev"), ("full-image", "Prev"))
 def prev_image():
+    pos = menu.focus_position - 1
     if (
-        menu.focus_position > 1
+        pos > 0
         # Don't scroll through directory items in image views
-        and main.menu_list[menu.focus_position - 2][1] is not ...  # Previous item
+        and main.menu_list[pos - 1][1] is not ...  # Previous item
     ):
-        menu.focus_position -= 1
-        main.displayer.send(menu.focus_position - 1)
+        menu.focus_position = pos
+        main.displayer.send(pos - 1)
 
     set_image_view_actions()
     set_menu_count()
@@ -564,9 +596,9 @@ def prev_image():
 @register_key(("image", "Next"), ("full-image", "Next"))
 def next_image():
     # `menu_list` is one item less than `menu` (at it's beginning), hence no `len - 1`
-    if menu.focus_position < len(main.menu_list):
-        menu.focus_position += 1
-        main.displayer.send(menu.focus_position - 1)
+    if (focus_position := menu.focus_position) < len(main.menu_list):
+        menu.focus_position = focus_position + 1
+        main.displayer.send(focus_position)
 
     set_image_view_actions()
     set_menu_count()
@@ -585,12 +617,15 @@ def force_render():
         image_w._ti_force_render = True
 
 
+@batch_action_bar_updates()
 def set_image_view_actions(context: str = None):
     context = context or main.get_context()
+    focus_position = menu.focus_position
+    menu_list = main.menu_list
     if (
-        menu.focus_position < 2
+        focus_position < 2
         # Previous item is a directory
-        or main.menu_list[menu.focus_position - 2][1] is ...
+        or menu_list[focus_position - 2][1] is ...
     ):
         disable_actions(context, "Prev")
     else:
@@ -599,7 +634,7 @@ def set_image_view_actions(context: str = None):
     if (
         # Last item
         main.menu_scan_done.is_set()
-        and menu.focus_position == len(main.menu_list)
+        and focus_position == len(menu_list)
     ):
         disable_actions(context, "Next")
     else:
@@ -633,18 +668,21 @@ def _confirm_delete(entry):
     else:
         successful = True
         main.displayer.send(main.MenuAction.DELETE)
-        confirmation.set_text(f"Successfully deleted {abspath(entry)}")
         confirmation.set_text(("green fg", "Successfully deleted!"))
-    main.loop.draw_screen()
-    sleep(1)
 
+    # Keep the outcome on screen for a moment, without blocking the event loop
+    disable_actions("confirmation", "Confirm", "Cancel")
+    main.loop.set_alarm_in(1, _finish_delete, successful)
+
+
+def _finish_delete(loop: urwid.MainLoop, successful: bool) -> None:
     if successful:
         next(main.displayer)  # Render next image view
         if not main.menu_list or main.menu_list[menu.focus_position - 1][1] is ...:
             # All menu entries have been deleted OR selected menu item is a directory
             main_widget.contents[0] = (pile, ("weight", 1))
             viewer.focus_position = 0
-            # "confirmation:Confirm" calls `set_prev_context()`
+            # Restored by `set_prev_context()` below
             main._prev_contexts[0] = (
                 "global" if main.at_top_level and not main.menu_list else "menu"
             )
@@ -654,14 +692,18 @@ def _confirm_delete(entry):
         view.original_widget = _prev_view_widget
         _cancel_delete()
 
+    main.set_prev_context()
+    enable_actions("confirmation", "Confirm", "Cancel")
+
 
 def _cancel_delete():
+    prev_context = main.get_prev_context()
     main_widget.contents[0] = (
-        view if main.get_prev_context() == "full-image" else pile,
+        view if prev_context == "full-image" else pile,
         ("weight", 1),
     )
-    if main.get_prev_context() in {"image", "full-image"}:
-        set_image_view_actions(main.get_prev_context())
+    if prev_context in {"image", "full-image"}:
+        set_image_view_actions(prev_context)
 
 
 # menu, image, image-grid
@@ -688,9 +730,8 @@ def switch_pane():
 # confirmation
 @register_key(("confirmation", "Confirm"))
 def confirm():
-    # `_confirm()` must [re]set `view.original_widget`
+    # `_confirm()` must [re]set `view.original_widget` and restore the previous context
     _confirm[0](*_confirm[1])
-    main.set_prev_context()
 
 
 @register_key(("confirmation", "Cancel"))
@@ -716,6 +757,53 @@ no_globals = {"global", "confirmation", "full-grid-image", "overlay"}
 action_bar._ti_collapsed = True
 expand._ti_shown = True
 
+# Constant parts of the help menu, used by `display_context_help()`
+_help_line = urwid.SolidFill("\u2500")
+_help_top_border, _help_divider, _help_bottom_border = (
+    (
+        1,
+        urwid.Columns(
+            [
+                ("weight", 3, _help_line),
+                (1, urwid.Filler(urwid.Text(joint))),
+                ("weight", 2, _help_line),
+                (1, urwid.Filler(urwid.Text(joint))),
+                ("weight", 5, _help_line),
+            ],
+            min_width=5,
+        ),
+    )
+    for joint in ("\u252c", "\u253c", "\u2534")
+)
+_help_separator = (1, urwid.Filler(urwid.Text("\u2502" * 3)))
+_help_about = (
+    "pack",
+    urwid.LineBox(
+        urwid.Text(
+            [
+                ("default bold", f"TermVisage v{__version__}\n"),
+                "\n",
+                ("default bold", "Homepage: "),
+                "https://github.com/AnonymouX47/termvisage\n",
+                ("default bold", "Docs: "),
+                "https://termvisage.readthedocs.io\n",
+                ("default bold", "Issue Tracker: "),
+                "https://github.com/AnonymouX47/termvisage/issues\n",
+                ("default bold", "Changelog: "),
+                "https://github.com/AnonymouX47/termvisage/blob/main/CHANGELOG.md\n",
+                ("default bold", "License: "),
+                "https://github.com/AnonymouX47/termvisage/blob/main/LICENSE\n",
+                "\n",
+                ("default bold", "Copyright (c) 2023 Toluwaleke Ogundipe"),
+            ],
+            "center",
+        ),
+        "About",
+        "center",
+        "default bold",
+    ),
+)
+
 # Used in the "confirmation" context.
 #
 # Updated by `set_confirmation()`.
@@ -725,14 +813,47 @@ _cancel: tuple[FunctionType, tuple[Any, ...]] | None = None
 # Used for overlays
 _prev_view_widget: urwid.Widget | None = None
 
+# Used to defer and coalesce action bar updates.
+#
+# Updated from `batch_action_bar_updates()` and `update_action_bar()`.
+_action_bar_batch_depth: int = 0
+# A dict (with `None` values), for the updates to be applied in the order requested
+_pending_action_bar_updates: dict[str, None] = {}
+
+# {<context>: [(<action>, <context_keys entry>), ...], ...}
+#
+# Visible actions listed in the help menu for each context, computed on demand.
+# Invalidated by `hide_actions()` and `show_actions()`.
+_help_actions: dict[str, list[tuple[str, list]]] = {}
+
+# The menu count last displayed in the menu box title.
+#
+# Updated from `set_menu_count()`.
+_menu_count: str = ""
+
+# Clears images drawn with the active render style, if it supports/requires that.
+# Returns `True` otherwise.
+#
+# Set from `.tui.init()`.
+_clear_images: Callable[[], bool | None]
+
+# Delay (in seconds) after the last of a burst of resize events, before the TUI is
+# updated for the new terminal size.
+RESIZE_DELAY = 0.05
+
+# The pending alarm for the TUI update after terminal resize events.
+#
+# Updated from `resize()` and `_resize()`.
+_resize_alarm: Any = None
+
 # Used to guard grid render refresh upon terminal resize, for text-based styles.
 #
-# Updated from `resize()`.
+# Updated from `_resize()`.
 _prev_cell_ratio: float = 0.0
 
 # Used to [re]compute the grid thumbnailing threshold.
 # Also used to guard grid render refresh on terminal resize, for graphics-based styles.
 #
 # The default value is for text-based styles, for which this variable is never updated.
-# Updated from `.tui.init()` and `resize()`, for graphics-based styles.
+# Updated from `.tui.init()` and `_resize()`, for graphics-based styles.
 _prev_cell_size: tuple[int, int] = (1, 2)
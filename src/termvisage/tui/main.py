@@ -4,12 +4,14 @@ from __future__ import annotations
 
 import logging as _logging
 import os
+from collections import deque
 from enum import Enum, auto
 from operator import mul
-from os.path import abspath, basename, isfile, islink
+from os.path import abspath, basename, islink, normpath
 from pathlib import Path
 from queue import Queue
 from threading import Event
+from time import monotonic
 from typing import Callable, Dict, Generator, Iterable, List, Optional, Tuple, Union
 
 import PIL
@@ -20,11 +22,13 @@ from term_image.utils import write_tty
 from .. import logging, notify
 from ..config import context_keys, expand_key
 from ..ctlseqs import BEL_b
+from . import keys as tui_keys
 from .keys import (
     disable_actions,
     enable_actions,
     keys,
     no_globals,
+    redraw_images,
     set_image_grid_actions,
     set_image_view_actions,
     set_menu_actions,
@@ -33,9 +37,7 @@ from .keys import (
 from .render import resync_grid_rendering
 from .widgets import (
     Image,
-    ImageCanvas,
     LineSquare,
-    MenuEntry,
     action_bar,
     image_box,
     image_grid,
@@ -165,7 +167,7 @@ def display_images(
             image_box.original_widget = placeholder  # halt image and anim rendering
             image_box.set_title("Image")
             view.original_widget = image_box
-            getattr(ImageClass, "clear", lambda: True)()
+            tui_keys._clear_images()
 
         # Implements "menu::Open" action (for non-image entries)
         elif pos == MenuAction.OPEN:
@@ -269,10 +271,12 @@ def display_images(
                 if value._ti_image.is_animated:
                     animate_image(value)
             else:  # Directory
+                entry_contents = contents[entry]
+                has_images = entry_contents.get("/")
                 grid_acknowledge.clear()
                 grid_active.set()
 
-                next_grid.put((entry, contents[entry]))
+                next_grid.put((entry, entry_contents))
                 # No need to wait for acknowledgement since this is a new list instance
                 _grid_list = []
                 # Absolute paths work fine with symlinked images and directories,
@@ -280,7 +284,7 @@ def display_images(
                 # e.g in `.tui.render.manage_grid_renders()`.
                 grid_path = abspath(entry)
 
-                if contents[entry].get("/") and grid_path != last_non_empty_grid_path:
+                if has_images and grid_path != last_non_empty_grid_path:
                     resync_grid_rendering()
                     last_non_empty_grid_path = grid_path
 
@@ -289,7 +293,7 @@ def display_images(
                 view.original_widget = image_grid_box
                 image_grid_box.base_widget._invalidate()
 
-                if contents[entry].get("/"):
+                if has_images:
                     enable_actions("menu", "Switch Pane")
                 else:
                     disable_actions("menu", "Switch Pane")
@@ -301,7 +305,7 @@ def display_images(
                 # GridScanner in the course of generating the display widget.
                 grid_acknowledge.wait()
 
-            getattr(ImageClass, "clear", lambda: True)() or ImageCanvas.change()
+            redraw_images()
 
         prev_pos = pos
         pos = yield
@@ -332,13 +336,13 @@ def process_input(key: str) -> bool:
         info_bar.set_text(f"{key!r} {info_bar.text}")
 
     found = False
-    if key in keys["global"]:
+    if global_key := keys["global"].get(key):
         if (
             _context not in no_globals
             or _context == "global"
             or key in {"resized", expand_key[0]}
         ):
-            func, state = keys["global"][key]
+            func, state = global_key
             func() if state else write_tty(BEL_b)
             found = True
 
@@ -411,6 +415,8 @@ def scan_dir(
     - If a dotted entry has the same main-name as another entry, the dotted one comes
       first.
     """
+    # The paths of the entries are absolute if that of the directory is
+    dir = abspath(dir)
     _entries = sorted(os.scandir(dir), key=sort_key or sort_key_lexi)
     entries = iter(_entries)
     if last_entry:
@@ -422,13 +428,13 @@ def scan_dir(
 
     errors = 0
     for entry in entries:
-        kind = scan_dir_entry(entry, contents)
+        kind, image = scan_dir_entry(entry, contents)
         if kind is EntryKind.UNREADABLE:
             errors += 1
         yield kind, (
             entry.name,
             (
-                Image(ImageClass.from_file(entry.path))
+                Image(image)
                 if kind is EntryKind.IMAGE
                 else ... if kind is EntryKind.DIR else None
             ),
@@ -436,7 +442,7 @@ def scan_dir(
 
     if notify_errors and errors:
         notify.notify(
-            f"{errors} file(s) could not be read in {abspath(dir)!r}! Check the logs.",
+            f"{errors} file(s) could not be read in {dir!r}! Check the logs.",
             level=notify.ERROR,
         )
 
@@ -447,26 +453,32 @@ def scan_dir_entry(
     entry: Union[os.DirEntry, Path],
     contents: Dict[str, Union[bool, Dict[str, Union[bool, dict]]]],
     entry_path: Optional[str] = None,
-) -> EntryKind:
-    """Scans a single directory entry and returns its kind."""
+) -> Tuple[EntryKind, Optional[BaseImage]]:
+    """Scans a single directory entry and returns its kind, along with the image
+    (``None`` for any other kind of entry).
+
+    Each file is opened only once, both to identify it and to create the image.
+    The path of *entry* is expected to be absolute.
+    """
     if not SHOW_HIDDEN and entry.name.startswith("."):
-        return EntryKind.HIDDEN
+        return EntryKind.HIDDEN, None
     if contents.get("/") and entry.is_file():
         try:
-            PIL.Image.open(abspath(entry))
+            # Only the header is read; nothing is decoded
+            image = ImageClass.from_file(os.fspath(entry))
         except PIL.UnidentifiedImageError:
             # Reporting will apply to every non-image file :(
-            return EntryKind.UNKNOWN
+            return EntryKind.UNKNOWN, None
         except Exception:
-            logging.log_exception(f"{abspath(entry)!r} could not be read", logger)
-            return EntryKind.UNREADABLE
+            logging.log_exception(f"{os.fspath(entry)!r} could not be read", logger)
+            return EntryKind.UNREADABLE, None
         else:
-            return EntryKind.IMAGE
+            return EntryKind.IMAGE, image
     if RECURSIVE and entry.name in contents:
         # `.cli.check_dir()` already eliminated bad symlinks
-        return EntryKind.DIR
+        return EntryKind.DIR, None
 
-    return EntryKind.UNKNOWN
+    return EntryKind.UNKNOWN, None
 
 
 def scan_dir_grid() -> None:
@@ -478,8 +490,25 @@ def scan_dir_grid() -> None:
     For each valid entry, a tuple ``(entry, value)``, like in ``scan_dir()``,
     is appended to ``.tui.main._grid_list`` and adds the *value* to the
     grid widget (for image entries only), then updates the screen.
+
+    Past the first page of the grid, entries are added in batches of up to
+    ``SCAN_BATCH_SIZE``, at most ``SCAN_BATCH_INTERVAL`` seconds apart.
     """
+
+    def flush_pending() -> None:
+        nonlocal last_flush_time
+
+        grid_list.extend(pending_list)
+        grid_contents.extend(pending_contents)
+        grid_list_box._invalidate()
+        pending_list.clear()
+        pending_contents.clear()
+        last_flush_time = monotonic()
+
     grid_contents = image_grid.contents
+    grid_list_box = image_grid_box.base_widget
+    pending_list = []
+    pending_contents = []
     while True:
         dir, contents = next_grid.get()
         grid_list = _grid_list
@@ -487,43 +516,53 @@ def scan_dir_grid() -> None:
         grid_acknowledge.set()  # Cleared grid contents
         grid_scan_done.clear()
         page_not_complete = True
+        last_flush_time = monotonic()
         notify.start_loading()
 
         for kind, item in scan_dir(dir, contents):
             if kind is EntryKind.IMAGE:
-                grid_list.append(item)
-                image_w = item[1]
-                image = image_w._ti_image
+                name, image_w = item
+                width, height = image_w._ti_image.original_size
                 border_attr = (
-                    "high-res"
-                    if 0 < MAX_PIXELS < mul(*image.original_size)
-                    else "focused box"
+                    "high-res" if 0 < MAX_PIXELS < width * height else "focused box"
                 )
-                grid_contents.append(
-                    (
-                        urwid.AttrMap(
-                            LineSquare(image_w, basename(image.source), border_attr),
-                            "unfocused box",
-                            border_attr,
-                        ),
-                        image_grid.options(),
-                    )
+                cell = (
+                    urwid.AttrMap(
+                        LineSquare(image_w, name, border_attr),
+                        "unfocused box",
+                        border_attr,
+                    ),
+                    image_grid.options(),
                 )
-                image_grid_box.base_widget._invalidate()
                 if page_not_complete:
-                    if len(grid_contents) <= image_grid_box.base_widget._ti_page_ncell:
+                    grid_list.append(item)
+                    grid_contents.append(cell)
+                    grid_list_box._invalidate()
+                    if len(grid_contents) <= grid_list_box._ti_page_ncell:
                         update_screen()
                     else:
                         page_not_complete = False
+                else:
+                    pending_list.append(item)
+                    pending_contents.append(cell)
             elif kind is EntryKind.DIR:
-                grid_list.append(item)
+                (grid_list if page_not_complete else pending_list).append(item)
 
+            if pending_list and (
+                len(pending_list) >= SCAN_BATCH_SIZE
+                or monotonic() - last_flush_time >= SCAN_BATCH_INTERVAL
+            ):
+                flush_pending()
             if not next_grid.empty():
+                flush_pending()
                 break
             if not grid_active.is_set():
+                # `_grid_list` may be used as the next menu list
+                flush_pending()
                 grid_acknowledge.set()
                 break
         else:
+            flush_pending()
             grid_scan_done.set()
             update_screen()
             # There is a possibility that `grid_scan_done` is read as "cleared"
@@ -542,43 +581,54 @@ def scan_dir_menu() -> None:
     For each valid entry, a tuple ``(entry, value)``, like in ``scan_dir()``,
     is appended to ``.tui.main.menu_list`` and appends a ``MenuEntry`` widget to the
     menu widget, then updates the screen.
+
+    Past the first page of the menu, entries are added in batches of up to
+    ``SCAN_BATCH_SIZE``, at most ``SCAN_BATCH_INTERVAL`` seconds apart.
     """
+
+    def flush_pending() -> None:
+        nonlocal last_flush_time
+
+        menu_body.extend(pending_items)
+        pending_items.clear()
+        last_flush_time = monotonic()
+
     menu_body = menu.body
+    pending_items = []
     while True:
         items, contents, menu_is_complete = next_menu.get()
         if menu_is_complete:
             continue
         page_not_complete = True
+        last_flush_time = monotonic()
         notify.start_loading()
 
         for kind, item in scan_dir(
             ".", contents, items[-1][0] if items else None, notify_errors=True
         ):
-            if kind is EntryKind.IMAGE:
-                items.append(item)
-                menu_body.append(
-                    urwid.AttrMap(MenuEntry(item[0]), "default", "focused entry")
-                )
-                if page_not_complete:
-                    if len(items) <= menu._ti_height:
-                        update_screen()
-                    else:
-                        page_not_complete = False
-            elif kind is EntryKind.DIR:
-                items.append(item)
-                menu_body.append(
-                    urwid.AttrMap(MenuEntry(item[0] + "/"), "default", "focused entry")
-                )
+            if kind is EntryKind.IMAGE or kind is EntryKind.DIR:
                 if page_not_complete:
+                    menu_body.append(item)  # Also appends to `items`
                     if len(items) <= menu._ti_height:
                         update_screen()
                     else:
                         page_not_complete = False
+                else:
+                    pending_items.append(item)
+
+            if pending_items and (
+                len(pending_items) >= SCAN_BATCH_SIZE
+                or monotonic() - last_flush_time >= SCAN_BATCH_INTERVAL
+            ):
+                flush_pending()
 
             if menu_change.is_set():
+                # Scanning resumes after the last item, when the menu is restored
+                flush_pending()
                 menu_acknowledge.set()
                 break
         else:
+            flush_pending()
             menu_scan_done.set()
             set_menu_count()
             update_screen()
@@ -594,13 +644,12 @@ def set_context(new_context) -> None:
     global _context
 
     if DEBUG:
-        info_bar.set_text(f"{_prev_contexts} {info_bar.text}")
-    _prev_contexts[1:] = _prev_contexts[:2]  # Right-shift older contexts
-    _prev_contexts[0] = _context
+        info_bar.set_text(f"{[*_prev_contexts]} {info_bar.text}")
+    _prev_contexts.appendleft(_context)  # The oldest context is discarded
     _context = new_context
     action_bar.update(new_context)
     if DEBUG:
-        info_bar.set_text(f"{new_context!r} {_prev_contexts} {info_bar.text}")
+        info_bar.set_text(f"{new_context!r} {[*_prev_contexts]} {info_bar.text}")
 
 
 def set_prev_context(n: int = 1) -> None:
@@ -608,24 +657,33 @@ def set_prev_context(n: int = 1) -> None:
     global _context
 
     if DEBUG:
-        info_bar.set_text(f"{_prev_contexts} {info_bar.text}")
+        info_bar.set_text(f"{[*_prev_contexts]} {info_bar.text}")
     _context = _prev_contexts[n - 1]
     action_bar.update(_context)
-    _prev_contexts[:n] = []
-    _prev_contexts.extend(["menu"] * n)
+    for _ in range(n):
+        _prev_contexts.popleft()
+        _prev_contexts.append("menu")
     if DEBUG:
-        info_bar.set_text(f"{_prev_contexts} {info_bar.text}")
+        info_bar.set_text(f"{[*_prev_contexts]} {info_bar.text}")
 
 
-def sort_key_lexi(entry: os.DirEntry | Path, actual_path: str = ""):
+def sort_key_lexi(entry: os.DirEntry | str, is_file: bool | None = None):
     """Lexicographic ordering key function.
 
     Compatible with ``list.sort()``, ``sorted()``, etc.
+
+    If *entry* is a path string, *is_file* must also be given, to avoid a ``stat()``
+    per entry; otherwise, it's determined from the directory entry (which usually
+    requires no system call).
     """
-    name = entry.name
+    if isinstance(entry, str):
+        name = basename(normpath(entry))
+    else:
+        name = entry.name
+        is_file = entry.is_file()
     return (
         # group directories before files
-        chr(isfile(actual_path) if actual_path else entry.is_file())
+        chr(is_file)
         # sort within each group, ignoring visibility and case
         + name.lstrip(".").casefold()
         # hidden before non-hidden of the same name; '\0' makes the key for the
@@ -642,23 +700,7 @@ def update_menu(
     global menu_list, at_top_level
     menu_list, at_top_level = items, top_level
 
-    menu.body[:] = [
-        (
-            urwid.Text(("inactive", ".."))
-            if top_level
-            else urwid.AttrMap(MenuEntry(".."), "default", "focused entry")
-        )
-    ]
-    menu.body += [
-        urwid.AttrMap(
-            MenuEntry(
-                (basename(entry) if at_top_level else entry) + "/" * (value is ...)
-            ),
-            "default",
-            "focused entry",
-        )
-        for entry, value in items
-    ]
+    menu.body._ti_set_items(items, top_level)
     menu.focus_position = pos + 1 + (at_top_level and pos == -1)
     set_menu_actions()
     set_menu_count()
@@ -670,15 +712,30 @@ def update_screen():
     Meant to be called from threads other than the thread in which the MainLoop is
     running.
     """
+    # Any update requested while one is pending will be covered by the pending one
+    if screen_update_pending.is_set():
+        return
+
+    screen_update_pending.set()
     try:
         os.write(update_pipe, b" ")
     except OSError as e:
+        screen_update_pending.clear()
         if e.errno != 9:
             logging.log_exception("Screen update failed", logger)
 
 
 logger = _logging.getLogger(__name__)
 
+# Cleared by the main loop (via `update_pipe`) just before the screen is redrawn
+screen_update_pending = Event()
+
+# Number of entries added at once to the menu and grid, past their first page,
+# while scanning a directory
+SCAN_BATCH_SIZE = 32
+# Maximum time (in seconds) for which scanned entries may be held back in a batch
+SCAN_BATCH_INTERVAL = 0.1
+
 # For grid scanning/display
 grid_acknowledge = Event()
 grid_active = Event()
@@ -697,7 +754,7 @@ menu_scan_done = Event()
 next_menu = Queue(1)
 
 # For Context Management
-_prev_contexts = ["menu"] * 3
+_prev_contexts = deque(["menu"] * 3, maxlen=3)
 _context = "menu"  # To avoid a NameError the first time set_context() is called.
 
 # Set by `update_menu()`
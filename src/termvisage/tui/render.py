@@ -6,7 +6,7 @@ import logging as _logging
 from collections import defaultdict
 from multiprocessing import Event as mp_Event, Lock as mp_Lock, Queue as mp_Queue
 from os import remove
-from queue import Empty, Queue
+from queue import Empty, Queue, SimpleQueue
 from threading import Event, Lock
 from typing import Union
 
@@ -76,22 +76,25 @@ def generate_grid_thumbnails(
     temp_dir: str,
 ) -> None:
     from glob import iglob
+    from hashlib import blake2b
     from os import fdopen, mkdir, scandir
     from shutil import copyfile
-    from sys import hash_info
     from tempfile import mkstemp
 
     from PIL.Image import Resampling, open as Image_open
 
+    try:
+        # Private. As of Pillow 10.x (as used by `Image.tobytes()`), the "raw" encoder
+        # it returns encodes into a buffer of the given size and returns
+        # `(bytes_written, status, data)`, with status `1` once the image is complete.
+        from PIL.Image import _getencoder
+    except ImportError:  # Removed or renamed in some other Pillow version
+        _getencoder = None
+
     THUMBNAIL_DIR = temp_dir + "/thumbnails"
     THUMBNAIL_FRAME_SIZE = (thumbnail_size,) * 2
     BOX = Resampling.BOX
     THUMBNAIL_MODES = {"RGB", "RGBA"}
-    # No of nibbles (hex digits) in the platform-specific hash integer type
-    HEX_HASH_WIDTH = hash_info.width // 4  # 4 bits -> 1 hex digit
-    # The max value for the unsigned counterpart of the platform-specific hash
-    # integer type
-    UINT_HASH_WIDTH_MAX = (1 << hash_info.width) - 1
 
     deduplicated_to_be_deleted: set[str] = set()
 
@@ -132,10 +135,25 @@ def generate_grid_thumbnails(
             )
             continue
 
-        img_bytes = img.tobytes()
-        # The hash is interpreted as an unsigned integer, represented in hex and
-        # zero-extended to fill up the platform-specific hash integer width.
-        img_hash = f"{hash(img_bytes) & UINT_HASH_WIDTH_MAX:0{HEX_HASH_WIDTH}x}"
+        # The digest is wide enough for thumbnails with the same digest to be taken
+        # as identical. The mode and size are included since thumbnails differing
+        # in either may still have the same pixel data.
+        hasher = blake2b(f"{img.mode} {img.size}".encode(), digest_size=16)
+        if _getencoder:
+            # Encoded in a single chunk, as opposed to the chunked encoding (and
+            # joining) done by `Image.tobytes()`
+            encoder = _getencoder(img.mode, "raw", img.mode)
+            encoder.setimage(img.im)
+            _, status, img_bytes = encoder.encode(
+                img.width * img.height * len(img.getbands())
+            )
+            if status != 1:  # incomplete?
+                img_bytes = img.tobytes()
+        else:
+            img_bytes = img.tobytes()
+        hasher.update(img_bytes)
+        del img_bytes  # Possibly relatively large
+        img_hash = hasher.hexdigest()
 
         # Create thumbnail file
         try:
@@ -145,7 +163,6 @@ def generate_grid_thumbnails(
             logging.log_exception(
                 f"Failed to create thumbnail file for {source!r}", logger
             )
-            del img_bytes  # Possibly relatively large
             img.close()
             continue
 
@@ -161,10 +178,6 @@ def generate_grid_thumbnails(
                 ):
                     continue
 
-                with Image_open(other_thumbnail) as other_img:
-                    if other_img.tobytes() != img_bytes:
-                        continue
-
                 try:
                     copyfile(other_thumbnail, thumbnail)
                 except Exception:
@@ -177,8 +190,6 @@ def generate_grid_thumbnails(
 
                 break
 
-        del img_bytes  # Possibly relatively large
-
         # Save thumbnail, if deduplication didn't work out
         if not deduplicated:
             with img, fdopen(thumbnail_fd, "wb") as thumbnail_file:
@@ -563,13 +574,25 @@ def manage_grid_thumbnails(thumbnail_size: int) -> None:
     # Always keep in mind that every directory entry is rendered only once per grid
     # since results are cached, at least for now.
 
+    def link_thumbnail_sources(thumbnail: str, sources: tuple[str]) -> None:
+        thumbnail_sources[thumbnail] = sources
+        thumbnails_by_n_sources[len(sources)][thumbnail] = None
+
+    def unlink_thumbnail_sources(thumbnail: str) -> tuple[str]:
+        sources = thumbnail_sources.pop(thumbnail)
+        n_sources = len(sources)
+        thumbnails = thumbnails_by_n_sources[n_sources]
+        del thumbnails[thumbnail]
+        if not thumbnails:
+            del thumbnails_by_n_sources[n_sources]
+        return sources
+
     def cache_thumbnail(source: str, thumbnail: str, deduplicated: str | None) -> None:
         # Eviction, for finite cache size
         if not deduplicated and 0 < THUMBNAIL_CACHE_SIZE == len(thumbnail_sources):
             # Evict the oldest thumbnail with the least amount of linked sources.
-            other_thumbnail = min(
-                thumbnail_sources,
-                key=lambda thumbnail: len(thumbnail_sources[thumbnail]),
+            other_thumbnail = next(
+                iter(thumbnails_by_n_sources[min(thumbnails_by_n_sources)])
             )
             # `thumbnail_render_lock` is unnecessary for just a membership test on
             # `thumbnails_being_rendered`; the outcome is the same as with the lock
@@ -592,7 +615,7 @@ def manage_grid_thumbnails(thumbnail_size: int) -> None:
                     # `thumbnail_render_lock` is unnecessary here since
                     # `other_thumbnail` is not in the render pipeline.
                     del thumbnail_cache[other_source]
-            del thumbnail_sources[other_thumbnail]
+            unlink_thumbnail_sources(other_thumbnail)
 
         thumbnail_cache[source] = thumbnail  # Link *source* to *thumbnail*.
 
@@ -604,8 +627,8 @@ def manage_grid_thumbnails(thumbnail_size: int) -> None:
         ):
             # Unlink *deduplicated* from the sources linked to it and link *thumbnail*
             # to them, along with *source*.
-            deduplicated_sources = thumbnail_sources.pop(deduplicated)
-            thumbnail_sources[thumbnail] = (*deduplicated_sources, source)
+            deduplicated_sources = unlink_thumbnail_sources(deduplicated)
+            link_thumbnail_sources(thumbnail, (*deduplicated_sources, source))
 
             with thumbnail_render_lock:
                 # Link to *thumbnail*, the sources linked to *deduplicated*.
@@ -623,7 +646,7 @@ def manage_grid_thumbnails(thumbnail_size: int) -> None:
                     with deduplication_lock:
                         delete_thumbnail(deduplicated)
         else:
-            thumbnail_sources[thumbnail] = (source,)
+            link_thumbnail_sources(thumbnail, (source,))
 
     multi = logging.MULTI
     thumbnail_in = (mp_Queue if multi else Queue)()
@@ -928,14 +951,17 @@ def render_images(
 
 
 logger = _logging.getLogger(__name__)
-anim_render_queue = Queue()
-grid_render_queue = Queue()
-grid_thumbnail_queue = Queue()
-image_render_queue = Queue()
+anim_render_queue = SimpleQueue()
+grid_render_queue = SimpleQueue()
+grid_thumbnail_queue = SimpleQueue()
+image_render_queue = SimpleQueue()
 grid_renderer_in_sync = Event()
 grid_thumbnailer_in_sync = Event()
 thumbnail_render_lock = Lock()
 thumbnail_sources: dict[str, tuple[str]] = {}
+# The thumbnails in `thumbnail_sources`, grouped by their number of linked sources,
+# each group in the same (insertion) order as in `thumbnail_sources`
+thumbnails_by_n_sources: defaultdict[int, dict[str, None]] = defaultdict(dict)
 # Main thumbnail cache
 thumbnail_cache: dict[str, str] = {}
 # For evicted and deduplicated thumbnails still being rendered
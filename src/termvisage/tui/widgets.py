@@ -82,10 +82,12 @@ class Action(urwid.WidgetWrap):
 
 class ActionBar(urwid.WidgetWrap):
     _ti_actions: list[Text]
+    _ti_rows_cache: dict[int, int]  # {maxcol: rows}; reset when actions change
 
     def __init__(self) -> None:
         super().__init__(Pile([]))
         self._ti_actions = []
+        self._ti_rows_cache = {}
 
     def render(self, size: tuple[int, int], focus: bool = False) -> Canvas:
         if widget_is_box := len(size) == 2:
@@ -131,6 +133,9 @@ class ActionBar(urwid.WidgetWrap):
 
     def rows(self, size: tuple[int, int], focus: bool = False) -> int:
         (maxcol,) = size
+        if maxcol in self._ti_rows_cache:
+            return self._ti_rows_cache[maxcol]
+
         n_rows = 1
         n_actions_on_row = row_width = 0
 
@@ -149,6 +154,8 @@ class ActionBar(urwid.WidgetWrap):
                 row_width += action_width + bool(n_actions_on_row)
                 n_actions_on_row += 1
 
+        self._ti_rows_cache[maxcol] = n_rows
+
         return n_rows
 
     def update(self, context: str) -> None:
@@ -177,6 +184,7 @@ class ActionBar(urwid.WidgetWrap):
                 in context_keys["global"].items()
                 if visible
             ]
+        self._ti_rows_cache.clear()
         keys.adjust_footer()
         self._invalidate()
 
@@ -234,9 +242,7 @@ class GridListBox(urwid.ListBox):
         if self._ti_grid_path == grid_path and not (
             self._ti_topmost is topmost and self._ti_top_trim == top_trim
         ):
-            getattr(
-                tui_main.ImageClass, "clear", lambda: True
-            )() or ImageCanvas.change()
+            keys.redraw_images()
 
         self._ti_topmost = topmost
         self._ti_top_trim = top_trim
@@ -404,7 +410,7 @@ class Image(urwid.Widget):
 
     # Set from `.tui.init()`
     _ti_alpha = ""
-    _ti_grid_style_spec = ""
+    _ti_grid_format_spec = ""
     # # Updated in `._ti_update_grid_thumbnailing_threshold()`
     _ti_grid_thumbnailing_threshold: ClassVar[int]
 
@@ -510,8 +516,7 @@ class Image(urwid.Widget):
         if view.original_widget is image_grid_box and context != "full-grid-image":
             try:
                 canv = ImageCanvas(
-                    f"{image:1.1{self._ti_alpha}{self._ti_grid_style_spec}}"
-                    .encode().split(b"\n"),  # fmt: skip
+                    format(image, self._ti_grid_format_spec).encode().split(b"\n"),
                     size,
                     image.rendered_size,
                 )
@@ -533,7 +538,7 @@ class Image(urwid.Widget):
                 ).render(size)
                 anim_render_queue.put(((repeat, frame_no), size, self._ti_force_render))
                 self._ti_frame = None  # Avoid resending
-                getattr(tui_main.ImageClass, "clear", lambda: True)()
+                keys._clear_images()
             else:
                 canv.size = size
         # has the image been rendered, with a valid-sized canvas?
@@ -762,6 +767,99 @@ class MenuListBox(urwid.ListBox):
         return super().render(size, focus)
 
 
+class MenuWalker(urwid.ListWalker):
+    """A list walker over the menu list (``(entry, value)`` tuples)
+
+    Position 0 is the ".." entry and every other position corresponds to the item
+    just before it in the menu list. Entry widgets are created only when first
+    requested e.g when scrolled into view, and reused until the menu list is replaced.
+    """
+
+    def __init__(self) -> None:
+        self.focus = 0
+        self._ti_items = []
+        self._ti_top_level = False
+        self._ti_entries = {}
+
+    def __getitem__(self, position: int) -> urwid.Widget:
+        try:
+            return self._ti_entries[position]
+        except KeyError:
+            pass
+
+        if position == 0:
+            entry_w = (
+                urwid.Text(("inactive", ".."))
+                if self._ti_top_level
+                else urwid.AttrMap(MenuEntry(".."), "default", "focused entry")
+            )
+        elif 0 < position <= len(self._ti_items):
+            entry, value = self._ti_items[position - 1]
+            entry_w = urwid.AttrMap(
+                MenuEntry(
+                    (basename(entry) if self._ti_top_level else entry)
+                    + "/" * (value is ...)
+                ),
+                "default",
+                "focused entry",
+            )
+        else:
+            raise IndexError(f"No widget at position {position}")
+
+        self._ti_entries[position] = entry_w
+        return entry_w
+
+    def __len__(self) -> int:
+        return len(self._ti_items) + 1
+
+    def _modified(self) -> None:
+        if self.focus >= len(self):
+            self.focus = len(self) - 1
+        super()._modified()
+
+    def append(self, item: Tuple[str, Image | type(...)]) -> None:
+        """Appends an item to the menu list"""
+        self._ti_items.append(item)
+        self._modified()
+
+    def extend(self, items: List[Tuple[str, Image | type(...)]]) -> None:
+        """Appends items to the menu list"""
+        self._ti_items.extend(items)
+        self._modified()
+
+    def next_position(self, position: int) -> int:
+        if position >= len(self._ti_items):
+            raise IndexError
+        return position + 1
+
+    def positions(self, reverse: bool = False) -> range:
+        return range(len(self._ti_items), -1, -1) if reverse else range(len(self))
+
+    def prev_position(self, position: int) -> int:
+        if position <= 0:
+            raise IndexError
+        return position - 1
+
+    def set_focus(self, position: int) -> None:
+        if not 0 <= position < len(self):
+            raise IndexError(f"No widget at position {position}")
+        self.focus = position
+        self._modified()
+
+    def _ti_set_items(
+        self, items: List[Tuple[str, Image | type(...)]], top_level: bool
+    ) -> None:
+        """Replaces the menu list.
+
+        *items* is used as is (not copied) i.e it's the same list appended to by
+        :py:meth:`append` and :py:meth:`extend`.
+        """
+        self._ti_items = items
+        self._ti_top_level = top_level
+        self._ti_entries.clear()
+        self._modified()
+
+
 class NoSwitchColumns(urwid.Columns):
     _command_map = urwid.command_map.copy()
     _command_map._command.clear()
@@ -777,7 +875,7 @@ class PlaceHolder(urwid.SolidFill):
 logger = _logging.getLogger(__name__)
 
 placeholder = PlaceHolder(" ")
-menu = MenuListBox(urwid.SimpleFocusListWalker([]))
+menu = MenuListBox(MenuWalker())
 menu_box = urwid.LineBox(menu, "List", "left")
 image_grid = urwid.GridFlow([placeholder], config_options.cell_width, 2, 1, "left")
 image_box = urwid.LineBox(placeholder, "Image", "left")
@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 from multiprocessing import Queue as mp_Queue
-from queue import Empty, Queue
+from queue import Empty, Queue, SimpleQueue
 
 
-def clear_queue(queue: Queue | mp_Queue):
+def clear_queue(queue: Queue | SimpleQueue | mp_Queue):
     """Purges the given queue"""
     while True:
         try: